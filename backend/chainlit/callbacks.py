@@ -1,21 +1,48 @@
-import inspect
-from typing import Any, Awaitable, Callable, Dict, List, Optional, Union
-
-from fastapi import Request, Response
-from mcp import ClientSession
-from starlette.datastructures import Headers
+import functools
+from typing import TYPE_CHECKING, Any, Awaitable, Callable, Dict, List, Optional, Union
 
 from chainlit.action import Action
 from chainlit.config import config
-from chainlit.context import context
+from chainlit.context import get_context
 from chainlit.data.base import BaseDataLayer
-from chainlit.mcp import McpConnection
 from chainlit.message import Message
 from chainlit.oauth_providers import get_configured_oauth_providers
 from chainlit.step import Step, step
 from chainlit.types import ChatProfile, Starter, ThreadDict
 from chainlit.user import User
-from chainlit.utils import wrap_user_function
+from chainlit.utils import get_signature, wrap_user_function
+
+if TYPE_CHECKING:
+    from fastapi import Request, Response
+    from mcp import ClientSession
+    from starlette.datastructures import Headers
+
+    from chainlit.mcp import McpConnection
+
+
+def _register(
+    attr: str,
+    func: Callable,
+    *,
+    with_task: bool = False,
+    step_name: Optional[str] = None,
+) -> None:
+    """
+    Build the final callable for a hook once and store it on config.code.
+
+    Args:
+        attr (str): The name of the hook attribute on config.code.
+        func (Callable): The user function to register.
+        with_task (bool): Whether to signal task start/end to the UI.
+        step_name (Optional[str]): If set, run the function inside a "run" step with that name.
+    """
+    if getattr(func, "__chainlit_wrapped__", False):
+        # Already built by a previous registration, reuse it as is
+        setattr(config.code, attr, func)
+        return
+
+    target = step(func, name=step_name, type="run") if step_name else func
+    setattr(config.code, attr, wrap_user_function(target, with_task=with_task))
 
 
 def on_app_startup(func: Callable[[], Union[None, Awaitable[None]]]) -> Callable:
@@ -36,7 +63,7 @@ def on_app_startup(func: Callable[[], Union[None, Awaitable[None]]]) -> Callable
     Returns:
         Callable[[], Union[None, Awaitable[None]]]: The decorated startup hook.
     """
-    config.code.on_app_startup = wrap_user_function(func, with_task=False)
+    _register("on_app_startup", func)
     return func
 
 
@@ -58,7 +85,7 @@ def on_app_shutdown(func: Callable[[], Union[None, Awaitable[None]]]) -> Callabl
     Returns:
         Callable[[], Union[None, Awaitable[None]]]: The decorated shutdown hook.
     """
-    config.code.on_app_shutdown = wrap_user_function(func, with_task=False)
+    _register("on_app_shutdown", func)
     return func
 
 
@@ -79,12 +106,12 @@ def password_auth_callback(
         Callable[[str, str], Awaitable[Optional[User]]]: The decorated authentication callback.
     """
 
-    config.code.password_auth_callback = wrap_user_function(func)
+    _register("password_auth_callback", func)
     return func
 
 
 def header_auth_callback(
-    func: Callable[[Headers], Awaitable[Optional[User]]],
+    func: Callable[["Headers"], Awaitable[Optional[User]]],
 ) -> Callable:
     """
     Framework agnostic decorator to authenticate the user via a header
@@ -100,7 +127,7 @@ def header_auth_callback(
         Callable[[Headers], Awaitable[Optional[User]]]: The decorated authentication callback.
     """
 
-    config.code.header_auth_callback = wrap_user_function(func)
+    _register("header_auth_callback", func)
     return func
 
 
@@ -123,22 +150,22 @@ def oauth_callback(
         Callable[[str, str, Dict[str, str], User, Optional[str]], Awaitable[Optional[User]]]: The decorated authentication callback.
     """
 
-    if len(get_configured_oauth_providers()) == 0:
+    if not get_configured_oauth_providers():
         raise ValueError(
             "You must set the environment variable for at least one oauth provider to use oauth authentication."
         )
 
-    config.code.oauth_callback = wrap_user_function(func)
+    _register("oauth_callback", func)
     return func
 
 
-def on_logout(func: Callable[[Request, Response], Any]) -> Callable:
+def on_logout(func: Callable[["Request", "Response"], Any]) -> Callable:
     """
     Function called when the user logs out.
     Takes the FastAPI request and response as parameters.
     """
 
-    config.code.on_logout = wrap_user_function(func)
+    _register("on_logout", func)
     return func
 
 
@@ -154,15 +181,30 @@ def on_message(func: Callable) -> Callable:
         Callable[[str], Any]: The decorated on_message function.
     """
 
+    if getattr(func, "__chainlit_wrapped__", False):
+        # Don't nest a second run step around an already built handler
+        _register("on_message", func)
+        return func
+
+    make_step = functools.partial(Step, name="on_message", type="run")
+
+    # The run step is always emitted, even without a data layer: the UI
+    # nests the replies under it and uses it to drive the loading state.
     async def with_parent_id(message: Message):
-        async with Step(name="on_message", type="run", parent_id=message.id) as s:
+        async with make_step(parent_id=message.id) as s:
+            s.input = message.content
+            await func(message)
+
+    async def with_parent_id_no_arg(message: Message):
+        async with make_step(parent_id=message.id) as s:
             s.input = message.content
-            if len(inspect.signature(func).parameters) > 0:
-                await func(message)
-            else:
-                await func()
+            await func()
 
-    config.code.on_message = wrap_user_function(with_parent_id)
+    # Pick the variant matching the handler's arity once, at decoration time
+    if len(get_signature(func).parameters) > 0:
+        _register("on_message", with_parent_id)
+    else:
+        _register("on_message", with_parent_id_no_arg)
     return func
 
 
@@ -173,7 +215,8 @@ async def send_window_message(data: Any):
     Args:
         data (Any): The data to send with the event.
     """
-    await context.emitter.send_window_message(data)
+    # Resolve the context directly rather than through the lazy proxy
+    await get_context().emitter.send_window_message(data)
 
 
 def on_window_message(func: Callable[[str], Any]) -> Callable:
@@ -187,7 +230,7 @@ def on_window_message(func: Callable[[str], Any]) -> Callable:
     Returns:
         Callable[[str], Any]: The decorated on_window_message function.
     """
-    config.code.on_window_message = wrap_user_function(func)
+    _register("on_window_message", func)
     return func
 
 
@@ -202,9 +245,7 @@ def on_chat_start(func: Callable) -> Callable:
         Callable[], Any]: The decorated hook.
     """
 
-    config.code.on_chat_start = wrap_user_function(
-        step(func, name="on_chat_start", type="run"), with_task=True
-    )
+    _register("on_chat_start", func, with_task=True, step_name="on_chat_start")
     return func
 
 
@@ -219,7 +260,7 @@ def on_chat_resume(func: Callable[[ThreadDict], Any]) -> Callable:
         Callable[], Any]: The decorated hook.
     """
 
-    config.code.on_chat_resume = wrap_user_function(func, with_task=True)
+    _register("on_chat_resume", func, with_task=True)
     return func
 
 
@@ -236,7 +277,7 @@ def set_chat_profiles(
         Callable[[Optional["User"]], Awaitable[List["ChatProfile"]]]: The decorated function.
     """
 
-    config.code.set_chat_profiles = wrap_user_function(func)
+    _register("set_chat_profiles", func)
     return func
 
 
@@ -253,7 +294,7 @@ def set_starters(
         Callable[[Optional["User"]], Awaitable[List["Starter"]]]: The decorated function.
     """
 
-    config.code.set_starters = wrap_user_function(func)
+    _register("set_starters", func)
     return func
 
 
@@ -268,7 +309,7 @@ def on_chat_end(func: Callable) -> Callable:
         Callable[], Any]: The decorated hook.
     """
 
-    config.code.on_chat_end = wrap_user_function(func, with_task=True)
+    _register("on_chat_end", func, with_task=True)
     return func
 
 
@@ -280,7 +321,7 @@ def on_audio_start(func: Callable) -> Callable:
         Callable[], Any]: The decorated hook.
     """
 
-    config.code.on_audio_start = wrap_user_function(func, with_task=False)
+    _register("on_audio_start", func)
     return func
 
 
@@ -295,7 +336,7 @@ def on_audio_chunk(func: Callable) -> Callable:
         Callable[], Any]: The decorated hook.
     """
 
-    config.code.on_audio_chunk = wrap_user_function(func, with_task=False)
+    _register("on_audio_chunk", func)
     return func
 
 
@@ -307,9 +348,7 @@ def on_audio_end(func: Callable) -> Callable:
         Callable[], Any]: The decorated hook.
     """
 
-    config.code.on_audio_end = wrap_user_function(
-        step(func, name="on_audio_end", type="run"), with_task=True
-    )
+    _register("on_audio_end", func, with_task=True, step_name="on_audio_end")
     return func
 
 
@@ -325,25 +364,27 @@ def author_rename(
         Callable[[Any, str], Awaitable[Any]]: The decorated function.
     """
 
-    config.code.author_rename = wrap_user_function(func)
+    _register("author_rename", func)
     return func
 
 
-def on_mcp_connect(func: Callable[[McpConnection, ClientSession], None]) -> Callable:
+def on_mcp_connect(
+    func: Callable[["McpConnection", "ClientSession"], None],
+) -> Callable:
     """
     Called everytime an MCP is connected
     """
 
-    config.code.on_mcp_connect = wrap_user_function(func)
+    _register("on_mcp_connect", func)
     return func
 
 
-def on_mcp_disconnect(func: Callable[[str, ClientSession], None]) -> Callable:
+def on_mcp_disconnect(func: Callable[[str, "ClientSession"], None]) -> Callable:
     """
     Called everytime an MCP is disconnected
     """
 
-    config.code.on_mcp_disconnect = wrap_user_function(func)
+    _register("on_mcp_disconnect", func)
     return func
 
 
@@ -358,7 +399,7 @@ def on_stop(func: Callable) -> Callable:
         Callable[[], Any]: The decorated stop hook.
     """
 
-    config.code.on_stop = wrap_user_function(func)
+    _register("on_stop", func)
     return func
 
 
@@ -371,7 +412,12 @@ def action_callback(name: str) -> Callable:
     """
 
     def decorator(func: Callable[[Action], Any]):
-        config.code.action_callbacks[name] = wrap_user_function(func, with_task=False)
+        if getattr(func, "__chainlit_wrapped__", False):
+            config.code.action_callbacks[name] = func
+        else:
+            config.code.action_callbacks[name] = wrap_user_function(
+                func, with_task=False
+            )
         return func
 
     return decorator
@@ -390,7 +436,7 @@ def on_settings_update(
         Callable[], Any]: The decorated hook.
     """
 
-    config.code.on_settings_update = wrap_user_function(func, with_task=True)
+    _register("on_settings_update", func, with_task=True)
     return func
 
 
@@ -425,5 +471,5 @@ def on_feedback(func: Callable) -> Callable:
     Returns:
         Callable[[Feedback], Any]: The decorated on_feedback function.
     """
-    config.code.on_feedback = wrap_user_function(func)
+    _register("on_feedback", func)
     return func
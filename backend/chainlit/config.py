@@ -324,7 +324,7 @@ class UISettings(DataClassJsonMixin):
     header_links: Optional[List[HeaderLink]] = None
 
 
-@dataclass()
+@dataclass(slots=True)
 class CodeSettings:
     # App action functions
     action_callbacks: Dict[str, Callable[["Action"], Any]]
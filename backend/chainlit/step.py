@@ -16,7 +16,7 @@ from chainlit.data import get_data_layer
 from chainlit.element import Element
 from chainlit.logger import logger
 from chainlit.types import FeedbackDict
-from chainlit.utils import utc_now
+from chainlit.utils import get_signature, utc_now
 
 
 def check_add_step_in_cot(step: "Step"):
@@ -67,7 +67,7 @@ class StepDict(TypedDict, total=False):
 
 
 def flatten_args_kwargs(func, args, kwargs):
-    signature = inspect.signature(func)
+    signature = get_signature(func)
     bound_arguments = signature.bind(*args, **kwargs)
     bound_arguments.apply_defaults()
     return {k: deepcopy(v) for k, v in bound_arguments.arguments.items()}
@@ -327,8 +327,9 @@ class Step:
                     raise e
                 logger.error(f"Failed to persist step update: {e!s}")
 
-        tasks = [el.send(for_id=self.id) for el in self.elements]
-        await asyncio.gather(*tasks)
+        if self.elements:
+            tasks = [el.send(for_id=self.id) for el in self.elements]
+            await asyncio.gather(*tasks)
 
         if not check_add_step_in_cot(self):
             await context.emitter.update_step(stub_step(self))
@@ -379,8 +380,9 @@ class Step:
                     raise e
                 logger.error(f"Failed to persist step creation: {e!s}")
 
-        tasks = [el.send(for_id=self.id) for el in self.elements]
-        await asyncio.gather(*tasks)
+        if self.elements:
+            tasks = [el.send(for_id=self.id) for el in self.elements]
+            await asyncio.gather(*tasks)
 
         if not check_add_step_in_cot(self):
             await context.emitter.send_step(stub_step(self))
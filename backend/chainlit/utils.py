@@ -2,6 +2,7 @@ import functools
 import importlib
 import inspect
 import os
+import weakref
 from asyncio import CancelledError
 from datetime import datetime, timezone
 from typing import Callable
@@ -27,6 +28,35 @@ def timestamp_utc(timestamp: float):
     return dt.isoformat() + "Z"
 
 
+_signatures: "weakref.WeakKeyDictionary[Callable, inspect.Signature]" = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def get_signature(func: Callable) -> inspect.Signature:
+    """
+    Get the signature of a callable, introspecting it only once.
+
+    Args:
+        func (Callable): The callable to inspect.
+
+    Returns:
+        inspect.Signature: The signature of the callable.
+    """
+    try:
+        return _signatures[func]
+    except (KeyError, TypeError):
+        # TypeError: the callable can't be weakly referenced
+        pass
+
+    signature = inspect.signature(func)
+    try:
+        _signatures[func] = signature
+    except TypeError:
+        pass
+    return signature
+
+
 def wrap_user_function(user_function: Callable, with_task=False) -> Callable:
     """
     Wraps a user-defined function to accept arguments as a dictionary.
@@ -38,25 +68,35 @@ def wrap_user_function(user_function: Callable, with_task=False) -> Callable:
         Callable: The wrapped function.
     """
 
+    # Get the parameter names of the user-defined function once, at wrap time
+    parameters = get_signature(user_function).parameters
+    user_function_params = list(parameters.keys())
+    # A *args parameter can't be passed by name, forward arguments positionally
+    has_var_positional = any(
+        param.kind is inspect.Parameter.VAR_POSITIONAL for param in parameters.values()
+    )
+    is_coroutine = inspect.iscoroutinefunction(user_function)
+
     @functools.wraps(user_function)
     async def wrapper(*args):
-        # Get the parameter names of the user-defined function
-        user_function_params = list(inspect.signature(user_function).parameters.keys())
-
-        # Create a dictionary of parameter names and their corresponding values from *args
-        params_values = {
-            param_name: arg for param_name, arg in zip(user_function_params, args)
-        }
+        if has_var_positional:
+            params_args, params_values = args, {}
+        else:
+            # Create a dictionary of parameter names and their corresponding values from *args
+            params_args = ()
+            params_values = {
+                param_name: arg for param_name, arg in zip(user_function_params, args)
+            }
 
         if with_task:
             await context.emitter.task_start()
 
         try:
             # Call the user-defined function with the arguments
-            if inspect.iscoroutinefunction(user_function):
-                return await user_function(**params_values)
+            if is_coroutine:
+                return await user_function(*params_args, **params_values)
             else:
-                return user_function(**params_values)
+                return user_function(*params_args, **params_values)
         except CancelledError:
             pass
         except Exception as e:
@@ -71,6 +111,9 @@ def wrap_user_function(user_function: Callable, with_task=False) -> Callable:
             if with_task:
                 await context.emitter.task_end()
 
+    # Mark the wrapper so that registering it again does not stack wrappers
+    wrapper.__chainlit_wrapped__ = True  # type: ignore[attr-defined]
+
     return wrapper
 
 
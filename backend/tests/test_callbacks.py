@@ -130,6 +130,43 @@ async def test_on_message(mock_chainlit_context, test_config: config.ChainlitCon
         context.session.emit.assert_called()
 
 
+async def test_on_message_without_argument(
+    mock_chainlit_context, test_config: config.ChainlitConfig
+):
+    import inspect
+    from unittest.mock import patch
+
+    from chainlit.callbacks import on_message
+    from chainlit.message import Message
+
+    async with mock_chainlit_context:
+        message_handled = False
+
+        @on_message
+        async def handle_message():
+            nonlocal message_handled
+            message_handled = True
+
+        # Call the registered callback
+        with patch("inspect.signature", wraps=inspect.signature) as signature:
+            await test_config.code.on_message(Message(content="Test message"))
+
+        # Check that the handler was called without the message
+        assert message_handled
+
+        # Check that the handler was not introspected again at dispatch time
+        assert all(call.args[0] is not handle_message for call in signature.mock_calls)
+
+
+async def test_send_window_message(mock_chainlit_context):
+    from chainlit.callbacks import send_window_message
+
+    async with mock_chainlit_context as context:
+        await send_window_message({"progress": 50})
+
+        context.session.emit.assert_called_once_with("window_message", {"progress": 50})
+
+
 async def test_on_stop(mock_chainlit_context, test_config: config.ChainlitConfig):
     from chainlit.callbacks import on_stop
 
@@ -151,6 +188,29 @@ async def test_on_stop(mock_chainlit_context, test_config: config.ChainlitConfig
         assert stop_called
 
 
+async def test_register_already_wrapped_callback(
+    mock_chainlit_context, test_config: config.ChainlitConfig
+):
+    from chainlit.callbacks import on_stop
+
+    async with mock_chainlit_context:
+        stop_calls = 0
+
+        @on_stop
+        async def handle_stop():
+            nonlocal stop_calls
+            stop_calls += 1
+
+        wrapped = test_config.code.on_stop
+
+        # Registering the built callable again should not wrap it a second time
+        on_stop(wrapped)
+        assert test_config.code.on_stop is wrapped
+
+        await test_config.code.on_stop()
+        assert stop_calls == 1
+
+
 async def test_action_callback(
     mock_chainlit_context, test_config: config.ChainlitConfig
 ):
@@ -177,6 +237,28 @@ async def test_action_callback(
         assert action_handled
 
 
+async def test_action_callback_with_var_positional(
+    mock_chainlit_context, test_config: config.ChainlitConfig
+):
+    from chainlit.action import Action
+    from chainlit.callbacks import action_callback
+
+    async with mock_chainlit_context:
+        received_args = None
+
+        @action_callback("test_action")
+        async def handle_action(*args):
+            nonlocal received_args
+            received_args = args
+
+        # Call the registered callback
+        test_action = Action(name="test_action", payload={"value": "test_value"})
+        await test_config.code.action_callbacks["test_action"](test_action)
+
+        # Check that the action was forwarded positionally
+        assert received_args == (test_action,)
+
+
 async def test_on_settings_update(
     mock_chainlit_context, test_config: config.ChainlitConfig
 ):